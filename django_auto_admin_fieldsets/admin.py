@@ -5,7 +5,12 @@ This utility provides a mixin class and a function to automatically add unspecif
 to a designated placeholder in Django ModelAdmin fieldsets.
 """
 
+import copy
+import warnings
+from collections.abc import Sequence
+from itertools import chain
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from django.contrib import admin
 
@@ -26,18 +31,56 @@ class AutoFieldsetsMixin:
     """
 
     remaining_fields_placeholder = "__remaining__"
+    _auto_fieldsets_plan = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Scan class-level fieldsets only once. The deep copy is used to
+        # detect modifications made to the fieldsets after class creation.
+        cls._auto_fieldsets_plan = None
+        fieldsets = getattr(cls, "fieldsets", None)
+        if not fieldsets:
+            return
+        try:
+            snapshot = copy.deepcopy(fieldsets)
+        except (AttributeError, TypeError, copy.Error):
+            # Options which cannot be copied always use the dynamic path
+            return
+        placeholder = cls.remaining_fields_placeholder
+        cls._auto_fieldsets_plan = _FieldsetsPlan(
+            fieldsets, snapshot, placeholder, _compile_plan(fieldsets, placeholder)
+        )
 
     def get_fieldsets(self, request, obj=None):
         """
         Override get_fieldsets to automatically add remaining fields to the designated placeholder.
         """
         fieldsets = super().get_fieldsets(request, obj)
-        return auto_add_fields_to_fieldsets(
-            model=self.model,
-            fieldsets=fieldsets,
-            exclude=getattr(self, "exclude", None) or [],
-            get_fields=lambda: self.get_fields(request, obj),
-            placeholder=self.remaining_fields_placeholder,
+
+        plan = self._auto_fieldsets_plan
+        if (
+            plan is not None
+            and fieldsets is plan.fieldsets
+            and fieldsets == plan.snapshot
+            and self.remaining_fields_placeholder == plan.placeholder
+        ):
+            if plan.add_remaining_fields is None:
+                return fieldsets
+            exclude = frozenset(getattr(self, "exclude", None) or ())
+            return plan.add_remaining_fields(exclude, self.get_fields(request, obj))
+
+        specified_fields, placeholder_location = _scan_fieldsets(
+            fieldsets, self.remaining_fields_placeholder
+        )
+        # Resolving the available fields builds a form, skip it if possible
+        if placeholder_location is None:
+            return fieldsets
+
+        return _add_remaining_fields(
+            fieldsets,
+            placeholder_location,
+            self.get_fields(request, obj),
+            skip=specified_fields | frozenset(getattr(self, "exclude", None) or ()),
         )
 
 
@@ -47,6 +90,140 @@ class AutoFieldsetsModelAdmin(AutoFieldsetsMixin, admin.ModelAdmin):
     """
 
 
+_EDITABLE_FIELDS_CACHE: WeakKeyDictionary[type, tuple[str, ...]] = WeakKeyDictionary()
+
+
+def _get_editable_field_names(model):
+    """
+    Return the names of all editable fields of ``model``, including
+    many-to-many fields. The result is cached per model class.
+    """
+    try:
+        return _EDITABLE_FIELDS_CACHE[model]
+    except KeyError:
+        pass
+
+    names = _EDITABLE_FIELDS_CACHE[model] = tuple(
+        field.name
+        for field in chain(model._meta.fields, model._meta.many_to_many)
+        if field.editable and not field.auto_created
+    )
+    return names
+
+
+class _PlaceholderLocation:
+    """
+    Position of the placeholder: the index of the section in the fieldsets
+    and the index of the placeholder in that section's fields.
+    """
+
+    __slots__ = ("index", "section")
+
+    def __init__(self, section, index):
+        self.section = section
+        self.index = index
+
+
+class _FieldsetsPlan:
+    """
+    Class-level fieldsets, a snapshot to detect later modifications and the
+    compiled function adding the remaining fields (``None`` without a
+    placeholder).
+    """
+
+    __slots__ = ("add_remaining_fields", "fieldsets", "placeholder", "snapshot")
+
+    def __init__(self, fieldsets, snapshot, placeholder, add_remaining_fields):
+        self.fieldsets = fieldsets
+        self.snapshot = snapshot
+        self.placeholder = placeholder
+        self.add_remaining_fields = add_remaining_fields
+
+
+def _scan_fieldsets(fieldsets, placeholder):
+    """
+    Return the set of field names specified in ``fieldsets`` and the location
+    of the placeholder as a ``_PlaceholderLocation``, or ``None``.
+    """
+    specified_fields = set()
+    add = specified_fields.add
+    update = specified_fields.update
+    placeholder_location = None
+
+    for section, (_name, options) in enumerate(fieldsets):
+        for i, field in enumerate(options.get("fields", ())):
+            # Plain field names are by far the most common entries
+            if type(field) is not str and isinstance(field, list | tuple):
+                update(field)
+            elif field == placeholder:
+                placeholder_location = _PlaceholderLocation(section, i)
+            else:
+                add(field)
+
+    return specified_fields, placeholder_location
+
+
+def _add_remaining_fields(fieldsets, placeholder_location, available_fields, skip):
+    """
+    Replace the placeholder with all available fields not contained in ``skip``.
+    """
+    # A plain comprehension beats set difference plus re-sorting by the
+    # original order, even for hundreds of fields
+    remaining_fields = [f for f in available_fields if f not in skip]
+
+    section = placeholder_location.section
+    placeholder_index = placeholder_location.index
+    name, options = fieldsets[section]
+    fields = options["fields"]
+    new_fields = (
+        *fields[:placeholder_index],
+        *remaining_fields,
+        *fields[placeholder_index + 1 :],
+    )
+    # Only the section containing the placeholder is replaced, all other
+    # sections are shared with the passed fieldsets which stay untouched
+    result = list(fieldsets)
+    result[section] = (name, {**options, "fields": new_fields})
+    return result
+
+
+def _compile_plan(fieldsets, placeholder):
+    """
+    Scan ``fieldsets`` once and return a function which only has to add the
+    remaining fields, given the excluded and the available fields.
+
+    Returns ``None`` if ``fieldsets`` do not contain the placeholder.
+    """
+    specified_fields, placeholder_location = _scan_fieldsets(fieldsets, placeholder)
+    if placeholder_location is None:
+        return None
+    specified_fields = frozenset(specified_fields)
+
+    def plan(exclude, available_fields):
+        return _add_remaining_fields(
+            fieldsets,
+            placeholder_location,
+            available_fields,
+            skip=specified_fields | exclude,
+        )
+
+    return plan
+
+
+def _without(entries, remove):
+    """
+    Yield field entries, dropping the fields for which ``remove`` returns
+    true. Groups which end up with a single field are collapsed.
+    """
+    for entry in entries:
+        if type(entry) is not str and isinstance(entry, list | tuple):
+            filtered = tuple(item for item in entry if not remove(item))
+            if filtered:
+                yield filtered[0] if len(filtered) == 1 else filtered
+        elif not remove(entry):
+            yield entry
+
+
 def remove_fields_from_fieldsets(
     fieldsets: tuple[tuple[str | None, dict[str, Any]], ...]
     | list[tuple[str | None, dict[str, Any]]],
@@ -67,36 +244,28 @@ def remove_fields_from_fieldsets(
         ``remove_fields_from_fieldsets(fieldsets, "hide_title")``
         ``remove_fields_from_fieldsets(fieldsets, ["hide_title", "noindex"])``
     """
-    if isinstance(field_name, str):
-        fields_to_remove = {field_name}
-    elif isinstance(field_name, (list, tuple, set, frozenset)):
-        fields_to_remove = set(field_name)
-    else:
-        fields_to_remove = {field_name}
-
-    cleaned = []
-    for name, options in fieldsets:
-        fields = []
-        for entry in options.get("fields", ()):
-            normalized = entry
-            if isinstance(entry, (list, tuple)):
-                filtered = tuple(item for item in entry if item not in fields_to_remove)
-                if not filtered:
-                    continue
-                normalized = filtered[0] if len(filtered) == 1 else filtered
-            elif entry in fields_to_remove:
-                continue
-            fields.append(normalized)
-        cleaned.append((name, {**options, "fields": tuple(fields)}))
-    return cleaned
+    fields_to_remove = (
+        frozenset((field_name,))
+        if isinstance(field_name, str)
+        else frozenset(field_name)
+    )
+    remove = fields_to_remove.__contains__
+    return [
+        (
+            name,
+            {**options, "fields": tuple(_without(options.get("fields", ()), remove))},
+        )
+        for name, options in fieldsets
+    ]
 
 
 def auto_add_fields_to_fieldsets(
     model: Any,
     fieldsets: list[tuple[str, dict[str, Any]]],
-    exclude: list[str] = None,
-    get_fields=None,
+    exclude: list[str] | None = None,
+    available_fields: Sequence[str] | None = None,
     placeholder: str = "__remaining__",
+    get_fields=None,
 ) -> list[tuple[str, dict[str, Any]]]:
     """
     Utility function to automatically add unspecified fields to a designated placeholder in fieldsets.
@@ -105,59 +274,38 @@ def auto_add_fields_to_fieldsets(
         model: The Django model class
         fieldsets: The fieldsets list to process
         exclude: List of field names to exclude (optional)
-        get_fields: Function to get all available fields, if needed for custom cases
+        available_fields: All available field names, defaults to the editable model fields
         placeholder: The placeholder string to look for in fieldsets
+        get_fields: Deprecated, function returning all available field names
 
     Returns:
         Updated fieldsets with remaining fields added to the placeholder location
     """
-    exclude = exclude or []
-
-    # Get all field names from the model
-    model_fields = list(model._meta.fields)
-    # Add many-to-many fields
-    model_fields.extend(list(model._meta.many_to_many))
-
-    model_fields = [
-        field.name
-        for field in model_fields
-        if field.editable and not field.auto_created
-    ]
+    if callable(available_fields):
+        # get_fields used to be the fourth positional argument
+        get_fields, available_fields = available_fields, None
+    if get_fields is not None:
+        warnings.warn(
+            "The get_fields argument of auto_add_fields_to_fieldsets is"
+            " deprecated, pass available_fields instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
 
-    # Get fields that are already specified in fieldsets
-    specified_fields = set()
-    placeholder_location = None
+    exclude = frozenset(exclude or ())
 
-    for name, options in fieldsets:
-        field_list = list(options.get("fields", []))
-        for i, field in enumerate(field_list):
-            if field == placeholder:
-                placeholder_location = (name, options, i)
-            elif isinstance(field, list | tuple):
-                specified_fields.update(field)
-            else:
-                specified_fields.add(field)
+    specified_fields, placeholder_location = _scan_fieldsets(fieldsets, placeholder)
+    if placeholder_location is None:
+        return fieldsets
 
-    # For edge cases where we need the custom get_fields
-    if get_fields:
+    if get_fields is not None:
         available_fields = get_fields()
-    else:
-        available_fields = model_fields
-
-    # Find fields that haven't been specified in fieldsets
-    remaining_fields = [
-        f
-        for f in available_fields
-        if f not in specified_fields
-        and f not in exclude
-        and (not f.startswith("_") or f in available_fields)
-    ]
-
-    # Add remaining fields to the placeholder location if it exists
-    if placeholder_location:
-        name, options, placeholder_index = placeholder_location
-        field_list = list(options.get("fields", []))
-        field_list[placeholder_index : placeholder_index + 1] = remaining_fields
-        options["fields"] = field_list
+    elif available_fields is None:
+        available_fields = _get_editable_field_names(model)
 
-    return fieldsets
+    return _add_remaining_fields(
+        fieldsets,
+        placeholder_location,
+        available_fields,
+        skip=specified_fields | exclude,
+    )
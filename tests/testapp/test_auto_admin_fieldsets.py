@@ -2,7 +2,7 @@ import copy
 
 from django.contrib import admin
 from django.db import models
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
 
 from django_auto_admin_fieldsets.admin import (
     AutoFieldsetsMixin,
@@ -28,6 +28,10 @@ class TestModel(models.Model):
         return self.title
 
 
+class FieldGroup(list):
+    pass
+
+
 # Test admin classes
 class TestAdminWithMixin(AutoFieldsetsMixin, admin.ModelAdmin):
     model = TestModel
@@ -92,10 +96,90 @@ class TestStandaloneFunction(TestCase):
             result,
             [
                 ("Basic", {"fields": [("title", "slug")]}),
-                ("Extra", {"fields": ["description", "published", "featured"]}),
+                ("Extra", {"fields": ("description", "published", "featured")}),
             ],
         )
 
+    def test_with_field_group_subclass(self):
+        fieldsets = [
+            ("Basic", {"fields": [FieldGroup(["title", "slug"])]}),
+            ("Extra", {"fields": ["__remaining__"]}),
+        ]
+
+        result = auto_add_fields_to_fieldsets(model=TestModel, fieldsets=fieldsets)
+
+        self.assertEqual(
+            result[1][1]["fields"], ("description", "published", "featured")
+        )
+
+    def test_does_not_mutate_input(self):
+        fieldsets = [
+            ("Basic", {"fields": ["title", "slug"]}),
+            ("Extra", {"fields": ["__remaining__"]}),
+        ]
+        original = copy.deepcopy(fieldsets)
+
+        result = auto_add_fields_to_fieldsets(model=TestModel, fieldsets=fieldsets)
+
+        self.assertEqual(fieldsets, original)
+        self.assertIs(result[0], fieldsets[0])
+        self.assertEqual(
+            result[1][1]["fields"], ("description", "published", "featured")
+        )
+
+    def test_without_remaining_fields(self):
+        fieldsets = [
+            ("Basic", {"fields": ["title", "slug", "description"]}),
+            ("Extra", {"fields": ["published", "__remaining__", "featured"]}),
+        ]
+
+        result = auto_add_fields_to_fieldsets(model=TestModel, fieldsets=fieldsets)
+
+        self.assertEqual(result[1], ("Extra", {"fields": ("published", "featured")}))
+
+    def test_without_placeholder(self):
+        fieldsets = [
+            ("Basic", {"fields": ["title", "slug"]}),
+        ]
+
+        result = auto_add_fields_to_fieldsets(model=TestModel, fieldsets=fieldsets)
+
+        self.assertIs(result, fieldsets)
+
+    def test_with_available_fields(self):
+        fieldsets = [
+            ("Basic", {"fields": ["title", "slug"]}),
+            ("Extra", {"fields": ["__remaining__"]}),
+        ]
+
+        result = auto_add_fields_to_fieldsets(
+            model=TestModel,
+            fieldsets=fieldsets,
+            available_fields=["title", "slug", "featured", "created_at"],
+        )
+
+        self.assertEqual(result[1][1]["fields"], ("featured", "created_at"))
+
+    def test_with_deprecated_get_fields(self):
+        fieldsets = [
+            ("Basic", {"fields": ["title", "slug"]}),
+            ("Extra", {"fields": ["__remaining__"]}),
+        ]
+
+        def get_fields():
+            return ["title", "slug", "featured"]
+
+        with self.assertWarns(DeprecationWarning):
+            result = auto_add_fields_to_fieldsets(
+                model=TestModel, fieldsets=fieldsets, get_fields=get_fields
+            )
+        self.assertEqual(result[1][1]["fields"], ("featured",))
+
+        # Passed positionally, as get_fields was the fourth argument
+        with self.assertWarns(DeprecationWarning):
+            result = auto_add_fields_to_fieldsets(TestModel, fieldsets, [], get_fields)
+        self.assertEqual(result[1][1]["fields"], ("featured",))
+
     def test_with_custom_placeholder(self):
         # Starting fieldsets with custom placeholder
         fieldsets = [
@@ -121,6 +205,22 @@ class TestStandaloneFunction(TestCase):
 
         self.assertEqual(set(remaining_fields), set(expected_remaining))
 
+    def test_with_runtime_placeholder(self):
+        fieldsets = [
+            ("Basic", {"fields": ["title", "slug"]}),
+            ("Extra", {"fields": ["__custom__"]}),
+        ]
+        # Built at runtime, so not the same object as the literal above
+        placeholder = "__CUSTOM__".lower()
+
+        result = auto_add_fields_to_fieldsets(
+            model=TestModel, fieldsets=fieldsets, placeholder=placeholder
+        )
+
+        self.assertEqual(
+            result[1][1]["fields"], ("description", "published", "featured")
+        )
+
     def test_with_exclude(self):
         # Starting fieldsets with placeholder
         fieldsets = [
@@ -144,6 +244,116 @@ class TestStandaloneFunction(TestCase):
         self.assertEqual(set(remaining_fields), set(expected_remaining))
 
 
+class TestAutoFieldsetsMixin(TestCase):
+    def setUp(self):
+        self.model_admin = TestAdminWithMixin(TestModel, admin.site)
+        self.request = RequestFactory().get("/")
+
+    def test_get_fieldsets(self):
+        result = self.model_admin.get_fieldsets(self.request)
+
+        self.assertEqual(
+            result,
+            [
+                ("Basic", {"fields": ["title", "slug"]}),
+                ("Extra", {"fields": ("description", "published", "featured")}),
+            ],
+        )
+        self.assertEqual(
+            TestAdminWithMixin.fieldsets[1], ("Extra", {"fields": ["__remaining__"]})
+        )
+
+    def test_get_fieldsets_without_placeholder(self):
+        class NoPlaceholderAdmin(AutoFieldsetsMixin, admin.ModelAdmin):
+            fieldsets = (("Basic", {"fields": ["title", "slug"]}),)
+
+            def get_fields(self, request, obj=None):
+                raise AssertionError("get_fields should not be called")
+
+        model_admin = NoPlaceholderAdmin(TestModel, admin.site)
+
+        self.assertIs(
+            model_admin.get_fieldsets(self.request), NoPlaceholderAdmin.fieldsets
+        )
+
+    def test_get_fieldsets_without_fieldsets(self):
+        calls = []
+
+        class DefaultAdmin(AutoFieldsetsMixin, admin.ModelAdmin):
+            def get_fields(self, request, obj=None):
+                calls.append(obj)
+                return super().get_fields(request, obj)
+
+        model_admin = DefaultAdmin(TestModel, admin.site)
+
+        result = model_admin.get_fieldsets(self.request)
+
+        self.assertEqual(
+            result[0][1]["fields"],
+            ["title", "slug", "description", "published", "featured"],
+        )
+        # Only the call from ModelAdmin.get_fieldsets itself
+        self.assertEqual(len(calls), 1)
+
+    def test_get_fieldsets_modified_class_fieldsets(self):
+        class ModifiedAdmin(AutoFieldsetsMixin, admin.ModelAdmin):
+            fieldsets = (
+                ("Basic", {"fields": ["title"]}),
+                ("Extra", {"fields": ["__remaining__"]}),
+            )
+
+        ModifiedAdmin.fieldsets[0][1]["fields"].append("slug")
+        model_admin = ModifiedAdmin(TestModel, admin.site)
+
+        result = model_admin.get_fieldsets(self.request)
+
+        self.assertEqual(
+            result[1][1]["fields"], ("description", "published", "featured")
+        )
+
+    def test_get_fieldsets_uncopyable_options(self):
+        class Description:
+            def __deepcopy__(self, memo):
+                raise TypeError("cannot copy")
+
+        class UncopyableAdmin(AutoFieldsetsMixin, admin.ModelAdmin):
+            fieldsets = (
+                ("Basic", {"fields": ["title", "slug"], "description": Description()}),
+                ("Extra", {"fields": ["__remaining__"]}),
+            )
+
+        model_admin = UncopyableAdmin(TestModel, admin.site)
+
+        result = model_admin.get_fieldsets(self.request)
+
+        self.assertEqual(
+            result[1][1]["fields"], ("description", "published", "featured")
+        )
+
+    def test_get_fieldsets_instance_fieldsets(self):
+        # Fieldsets which differ from the class-level fieldsets
+        self.model_admin.fieldsets = [
+            ("Basic", {"fields": ["title"]}),
+            ("Extra", {"fields": ["__remaining__"], "classes": ["wide"]}),
+        ]
+
+        result = self.model_admin.get_fieldsets(self.request)
+
+        self.assertEqual(
+            result,
+            [
+                ("Basic", {"fields": ["title"]}),
+                (
+                    "Extra",
+                    {
+                        "fields": ("slug", "description", "published", "featured"),
+                        "classes": ["wide"],
+                    },
+                ),
+            ],
+        )
+
+
 class TestRemoveFieldsFromFieldsets(TestCase):
     def test_remove_single_field(self):
         fieldsets = [
@@ -211,6 +421,28 @@ class TestRemoveFieldsFromFieldsets(TestCase):
             ],
         )
 
+    def test_remove_from_group_subclass(self):
+        fieldsets = [
+            ("Basic", {"fields": [FieldGroup(["title", "hide_title", "slug"])]}),
+        ]
+
+        result = remove_fields_from_fieldsets(fieldsets, "hide_title")
+
+        self.assertEqual(result, [("Basic", {"fields": (("title", "slug"),)})])
+
+    def test_remove_no_fields(self):
+        fieldsets = [
+            ("Basic", {"fields": ["title", ["slug"], [], ["author", "noindex"]]}),
+        ]
+
+        result = remove_fields_from_fieldsets(fieldsets, [])
+
+        self.assertEqual(
+            result,
+            [("Basic", {"fields": ("title", "slug", ("author", "noindex"))})],
+        )
+        self.assertIsNot(result[0][1], fieldsets[0][1])
+
     def test_remove_does_not_mutate_input(self):
         fieldsets = [
             ("Basic", {"fields": ["title", ["hide_title", "slug"]]}),